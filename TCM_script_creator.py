@@ -6,70 +6,187 @@ Converts pro settings from Excel/CSV to AutoHotkey scripts for easy sharing and
 
 import pandas as pd
 import argparse
+import functools
+import json
+import pickle
+import re
+import sys
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import IO, Dict, Iterator, List, NamedTuple, Optional, Tuple
 from pathlib import Path
 
+# Prefer the Rust-backed calamine reader, falling back to openpyxl
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
+
 # Configuration Constants
 SETTINGS_FILE = "settings.xlsx"
 
-# Setting change amounts per tick
-SETTING_INCREMENTS = {
-    "final_drive": 1,
-    "front_power_distrib": 1,  # Changes by 1% per tick
-    "grip_front": 1,
-    "grip_rear": 1,
-    "front_brake_balance": 1,  # Changes by 1% per tick
-    "brake_power": 1,
-    "load_front": 1,
-    "load_rear": 1,
-    "spring_front": 1,
-    "spring_rear": 1,
-    "compression_front": 1,
-    "compression_rear": 1,
-    "rebound_front": 1,
-    "rebound_rear": 1,
-    "arb_front": 1,
-    "arb_rear": 1,
-    "camber_front": 0.01,  # Special case: changes by 0.01 per tick
-    "camber_rear": 0.01    # Special case: changes by 0.01 per tick
+# Parsed workbook cache, stored next to the settings file. It is trusted local
+# state: a JSON key line is checked before the pickle body is ever loaded, but a
+# cache file written by someone else should be deleted, not shared.
+CACHE_SUFFIX = ".cache.pkl"
+CACHE_VERSION = 3  # Bump when the parser output format changes
+
+class SettingMeta(NamedTuple):
+    """Static metadata for one pro setting."""
+    increment: float                 # Change amount per tick
+    default: Optional[float] = None  # Start value for settings with non-zero defaults
+    needs_reset: bool = False        # Whether the setting is reset to its start value first
+    is_delta: bool = True            # Delta from default (True) or absolute value (False)
+
+# Per-setting metadata, in menu order
+SETTING_META = {
+    "final_drive": SettingMeta(1),
+    # Starts at 60%, changes by 1% per tick, decrease to lower value
+    "front_power_distrib": SettingMeta(1, default=60, needs_reset=True, is_delta=False),
+    "grip_front": SettingMeta(1),
+    "grip_rear": SettingMeta(1),
+    # Starts at 80%, changes by 1% per tick, decrease to lower value
+    "front_brake_balance": SettingMeta(1, default=80, needs_reset=True, is_delta=False),
+    "brake_power": SettingMeta(1),
+    "load_front": SettingMeta(1),
+    "load_rear": SettingMeta(1),
+    "spring_front": SettingMeta(1),
+    "spring_rear": SettingMeta(1),
+    "compression_front": SettingMeta(1),
+    "compression_rear": SettingMeta(1),
+    "rebound_front": SettingMeta(1),
+    "rebound_rear": SettingMeta(1),
+    "arb_front": SettingMeta(1),
+    "arb_rear": SettingMeta(1),
+    "camber_front": SettingMeta(0.01),  # Special case: changes by 0.01 per tick
+    "camber_rear": SettingMeta(0.01)    # Special case: changes by 0.01 per tick
 }
 
-# Settings with non-zero defaults and their ranges
-SETTING_DEFAULTS = {
-    "front_power_distrib": 60,  # Starts at 60%, decrease to lower value
-    "front_brake_balance": 80   # Starts at 80%, decrease to lower value
+# Prebuilt AutoHotkey lines for each keystroke
+SEND_LINES = {
+    "Right": "    Send {Right}",
+    "Left": "    Send {Left}",
+    "Down": "    Send {Down}"
 }
 
-# Whether each setting needs to be reset to start value first
-SETTING_NEEDS_RESET = {
-    "front_power_distrib": True,
-    "front_brake_balance": True
+# Fixed parts of the generated AutoHotkey script
+AHK_SCRIPT_HEADER = (
+    "#SingleInstance Force",
+    "SetWorkingDir %A_ScriptDir%",
+    "",
+    "; Command line mode support",
+    "if (A_Args.Length() > 0 && A_Args[1] = \"--cli\") {",
+    "    SetTimer, ApplySettings, -100  ; Run after 100ms",
+    "    return",
+    "}",
+    "",
+    "; Default starting positions:",
+    "; - Front Power Distribution: Starts at 60% (right to decrease)",
+    "; - Front Brake Balance: Starts at 80% (right to decrease)",
+    "; - All other settings: Start at 0",
+    "",
+    "; Auto-skipped settings (not available for this car):"
+)
+
+AHK_APPLY_START = (
+    "",
+    "ApplySettings:",
+    "{",
+    "    SetKeyDelay, 50, 50  ; Adjust timing if needed",
+    ""
+)
+
+AHK_SCRIPT_FOOTER = (
+    "",
+    "    if (A_Args.Length() > 0 && A_Args[1] = \"--cli\") {",
+    "        ExitApp",  # Exit immediately in CLI mode
+    "    } else {",
+    "        MsgBox, Settings applied!",
+    "    }",
+    "    return",
+    "}"
+)
+
+# Comment line introducing each setting's keystrokes
+ADJUST_COMMENTS = {
+    name: f"    ; Adjusting {name}" if meta.default is None
+    else f"    ; Adjusting {name} (from {meta.default}%)"
+    for name, meta in SETTING_META.items()
 }
 
-# Whether each setting is a delta from default (True) or absolute value (False)
-SETTING_IS_DELTA = {
-    "final_drive": True,
-    "front_power_distrib": False,  # Uses absolute values
-    "grip_front": True,
-    "grip_rear": True,
-    "front_brake_balance": False,  # Uses absolute values
-    "brake_power": True,
-    "load_front": True,
-    "load_rear": True,
-    "spring_front": True,
-    "spring_rear": True,
-    "compression_front": True,
-    "compression_rear": True,
-    "rebound_front": True,
-    "rebound_rear": True,
-    "arb_front": True,
-    "arb_rear": True,
-    "camber_front": True,
-    "camber_rear": True
+# Vehicle category sheets in the settings workbook
+VALID_CATEGORIES = ['STREET TIER 1', 'STREET TIER 2', 'RACING', 'DRIFT',
+                    'RALLY', 'RALLY RAID', 'HYPERCAR', 'DRAGSTER', 'ALPHA',
+                    'DEMOLITION DERBY', 'MONSTER TRUCK', 'MOTO']
+
+# Setting column identifiers
+SETTING_IDENTIFIERS = {
+    'Final Drive': 'final_drive',
+    'Front Power Distrib': 'front_power_distrib',
+    'Front Brake Balance': 'front_brake_balance',
+    'Brake Power': 'brake_power',
+    'Grip Front': 'grip_front',
+    'Grip Rear': 'grip_rear',
+    'Load Front': 'load_front',
+    'Load Rear': 'load_rear',
+    'Spring Front': 'spring_front',
+    'Spring Rear': 'spring_rear',
+    'Compression Front': 'compression_front',
+    'Compression Rear': 'compression_rear',
+    'Rebound Front': 'rebound_front',
+    'Rebound Rear': 'rebound_rear',
+    'ARB Front': 'arb_front',
+    'ARB Rear': 'arb_rear',
+    'Camber Front': 'camber_front',
+    'Camber Rear': 'camber_rear'
 }
 
-@dataclass
+SETTING_COLUMN_RE = re.compile(
+    '|'.join(re.escape(name) for name in sorted(SETTING_IDENTIFIERS, key=len, reverse=True))
+)
+
+# Non-car values to skip
+SKIP_VALUES = frozenset({'nan', 'NaN', '--', '', 'WELCOME', 'SETTINGS', 'CAR NAME'})
+
+# Known manufacturers to check
+MANUFACTURERS = frozenset({
+    'BMW', 'AUDI', 'MERCEDES', 'PORSCHE', 'FORD', 'CHEVROLET',
+    'DODGE', 'VOLKSWAGEN', 'MAZDA', 'NISSAN', 'HONDA', 'PLYMOUTH',
+    'MITSUBISHI', 'PROTO', 'JAGUAR', 'ALFA ROMEO', 'DELOREAN',
+    'BUICK', 'CADILLAC', 'FERRARI', 'HUMMER', 'JEEP', 'MASERATI',
+    'MINI', 'PONTIAC', 'RENAULT', 'SHELBY', 'TOYOTA', 'ABARTH',
+    'ASTON MARTIN', 'BUGATTI', 'CHRYSLER', 'LANCIA', 'LAND ROVER'
+})
+
+def _prefix_trie_pattern(words) -> str:
+    """Build a regex alternation with shared prefixes factored out.
+
+    Matching then walks a prefix trie, so finding a word costs O(len(word))
+    instead of one attempt per word.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}  # End of word marker
+
+    def build(node) -> str:
+        branches = [re.escape(char) + build(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # A word ending here may also prefix longer words; prefer the longest
+        return f"(?:{pattern})?" if '' in node else pattern
+
+    return build(trie)
+
+# Matches a car name and captures its manufacturer. Manufacturer grouping
+# rows such as "BMW / MINI" contain "/" and are not cars.
+CAR_NAME_RE = re.compile(r'^(' + _prefix_trie_pattern(MANUFACTURERS) + r')(?!.*/)')
+
+@dataclass(frozen=True)
 class CarSetting:
     """Represents a single car setting with its value and metadata."""
     name: str
@@ -77,28 +194,38 @@ class CarSetting:
     increment: float
     is_delta: bool
 
-    def get_keystrokes(self) -> List[str]:
-        """Convert setting value to required keystrokes."""
-        keystrokes = []
+    @functools.cached_property
+    def key_run(self) -> Tuple[str, int]:
+        """The key to press and how many times to press it, computed once."""
+        meta = SETTING_META.get(self.name)
         
         # Handle settings with non-zero defaults
-        if self.name in SETTING_DEFAULTS:
-            start_value = SETTING_DEFAULTS[self.name]
+        if meta and meta.default is not None:
             # Calculate ticks needed (moving right decreases value)
-            ticks = round((start_value - self.value) / self.increment)
-            if ticks > 0:
-                keystrokes.extend(["Right"] * ticks)
-            elif ticks < 0:
-                keystrokes.extend(["Left"] * abs(ticks))
-            return keystrokes
-        
+            ticks = round((meta.default - self.value) / self.increment)
         # For regular delta-based settings
-        if not self.value:
-            return []
+        elif not self.value:
+            ticks = 0
+        else:
+            ticks = round(self.value / self.increment)
         
-        ticks = round(self.value / self.increment)
         direction = "Right" if ticks > 0 else "Left"
-        return [direction] * abs(ticks)
+        return direction, abs(ticks)
+
+    @property
+    def direction(self) -> str:
+        """Key to press, "Right" or "Left"."""
+        return self.key_run[0]
+
+    @property
+    def keystroke_count(self) -> int:
+        """Number of key presses needed."""
+        return self.key_run[1]
+
+    def get_keystrokes(self) -> List[str]:
+        """Convert setting value to required keystrokes."""
+        key, count = self.key_run
+        return [key] * count
 
 class CarSetup:
     """Manages a complete car setup with all its settings."""
@@ -106,246 +233,293 @@ class CarSetup:
         self.settings = []
         self.auto_skipped_settings = []
         
-        # Get all possible settings in their expected order
-        all_settings = [
-            'final_drive', 'front_power_distrib', 'grip_front', 'grip_rear',
-            'front_brake_balance', 'brake_power', 'load_front', 'load_rear',
-            'spring_front', 'spring_rear', 'compression_front', 'compression_rear',
-            'rebound_front', 'rebound_rear', 'arb_front', 'arb_rear',
-            'camber_front', 'camber_rear'
-        ]
-        
         # Track the last included setting to know when to send Down
         last_included_setting = None
         
-        for name in all_settings:
-            if name in settings_dict and name in SETTING_INCREMENTS:
+        # Walk all possible settings in their expected order
+        for name, meta in SETTING_META.items():
+            if name in settings_dict:
                 value = settings_dict[name]
                 # Create setting with appropriate metadata
                 setting = CarSetting(
                     name=name,
                     value=value,
-                    increment=SETTING_INCREMENTS[name],
-                    is_delta=(name not in SETTING_DEFAULTS)
+                    increment=meta.increment,
+                    is_delta=meta.is_delta
                 )
                 self.settings.append(setting)
                 last_included_setting = name
             else:
                 self.auto_skipped_settings.append(name)
 
-    def generate_ahk_script(self) -> str:
-        """Generate AutoHotkey script for the car setup."""
-        script_lines = [
-            "#SingleInstance Force",
-            "SetWorkingDir %A_ScriptDir%",
-            "",
-            "; Command line mode support",
-            "if (A_Args.Length() > 0 && A_Args[1] = \"--cli\") {",
-            "    SetTimer, ApplySettings, -100  ; Run after 100ms",
-            "    return",
-            "}",
-            "",
-            "; Default starting positions:",
-            "; - Front Power Distribution: Starts at 60% (right to decrease)",
-            "; - Front Brake Balance: Starts at 80% (right to decrease)",
-            "; - All other settings: Start at 0",
-            "",
-            "; Auto-skipped settings (not available for this car):"
-        ]
+        # Look up included settings by name without scanning the list
+        self.by_name = {setting.name: setting for setting in self.settings}
+
+    def input_plan(self) -> List[Tuple[str, str, int]]:
+        """(setting name, key, presses) for each setting the script adjusts, in menu order."""
+        return [(setting.name, *setting.key_run) for setting in self.settings if setting.keystroke_count]
+
+    def generate_ahk_script(self, out: Optional[IO[str]] = None) -> Optional[str]:
+        """Generate AutoHotkey script for the car setup.
+
+        If ``out`` is given, the script is written to it line by line and
+        nothing is returned.
+        """
+        script_lines = self._iter_script_lines()
+        if out is None:
+            return "\n".join(script_lines)
+        out.writelines(f"{line}\n" for line in script_lines)
+
+    def _iter_script_lines(self) -> Iterator[str]:
+        """Yield the lines of the AutoHotkey script."""
+        yield from AHK_SCRIPT_HEADER
         
         # Add comments for skipped settings
         for setting in self.auto_skipped_settings:
-            script_lines.append(f"; - {setting}")
+            yield f"; - {setting}"
         
-        script_lines.extend([
-            "",
-            "ApplySettings:",
-            "{",
-            "    SetKeyDelay, 50, 50  ; Adjust timing if needed",
-            ""
-        ])
-
-        # Track if we need to move to the next setting
-        needs_down = False
-        
-        for setting in self.settings:
-            keystrokes = setting.get_keystrokes()
-            if keystrokes:
-                if setting.name in SETTING_DEFAULTS:
-                    script_lines.append(f"    ; Adjusting {setting.name} (from {SETTING_DEFAULTS[setting.name]}%)")
-                else:
-                    script_lines.append(f"    ; Adjusting {setting.name}")
-                
-                if needs_down:
-                    script_lines.append("    Send {Down}")  # Move to next setting
-                for key in keystrokes:
-                    script_lines.append(f"    Send {{{key}}}")
-                needs_down = True
-
-        script_lines.extend([
-            "",
-            "    if (A_Args.Length() > 0 && A_Args[1] = \"--cli\") {",
-            "        ExitApp",  # Exit immediately in CLI mode
-            "    } else {",
-            "        MsgBox, Settings applied!",
-            "    }",
-            "    return",
-            "}"
-        ])
-
-        return "\n".join(script_lines)
+        yield from AHK_APPLY_START
+
+        for index, (name, key, count) in enumerate(self.input_plan()):
+            yield ADJUST_COMMENTS[name]
+            
+            if index:
+                yield SEND_LINES["Down"]  # Move to next setting
+            # Repeat with AutoHotkey's {Key N} form; SetKeyDelay still applies per press
+            yield SEND_LINES[key] if count == 1 else f"    Send {{{key} {count}}}"
+
+        yield from AHK_SCRIPT_FOOTER
+
+def _dedupe_columns(header: Tuple) -> List:
+    """Name a header row the way pandas' Excel reader does.
+
+    Blank cells become "Unnamed: i", and repeats get ".1", ".2", ... suffixes.
+    Given names are numbered before blank ones, and suffixes already in use are skipped.
+    """
+    names = [f"Unnamed: {i}" if name is None else name for i, name in enumerate(header)]
+    unnamed = [i for i, name in enumerate(header) if name is None]
+    named = [i for i, name in enumerate(header) if name is not None]
+    counts = {}
+    for i in named + unnamed:
+        base = col = names[i]
+        count = counts.get(col, 0)
+        while count:
+            counts[base] = count + 1
+            col = f"{base}.{count}"
+            count = count + 1 if col in names else counts.get(col, 0)
+        names[i] = col
+        counts[col] = count + 1
+    return names
+
+def _read_sheet(settings_file: Path, sheet_name: str) -> pd.DataFrame:
+    """Read a sheet as strings, using calamine when it is available."""
+    if settings_file.suffix == '.csv':
+        return pd.read_csv(settings_file, dtype=str)
+    
+    if EXCEL_ENGINE == "calamine":
+        # Close the workbook straight away; an open handle locks the file for Excel on Windows
+        with pd.ExcelFile(settings_file, engine="calamine") as workbook:
+            return workbook.parse(sheet_name, dtype=str)
+
+    # Stream raw row tuples instead of going through pandas' openpyxl reader
+    import openpyxl
+    workbook = openpyxl.load_workbook(settings_file, read_only=True, data_only=True)
+    try:
+        rows = workbook[sheet_name].iter_rows(values_only=True)
+        header = _dedupe_columns(next(rows, ()))
+        width = len(header)
+        data = [row[:width] + (None,) * (width - len(row)) for row in rows]
+    finally:
+        workbook.close()
+    return pd.DataFrame(data, columns=header, dtype=str)
+
+def _parse_sheet(sheet_data: pd.DataFrame) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Extract car settings from a sheet, grouped by manufacturer."""
+    cars = {}
+
+    # Drop blank spacer rows up front so no per-cell work is spent on them
+    sheet_data = sheet_data.dropna(how='all')
+
+    # Find setting columns
+    setting_columns = {}
+    for col in sheet_data.columns:
+        match = SETTING_COLUMN_RE.search(str(col))
+        if match:
+            setting_columns[col] = SETTING_IDENTIFIERS[match.group()]
+
+    name_columns = [col for col in sheet_data.columns if col not in setting_columns]
+    if not setting_columns or not name_columns:
+        return cars
+
+    # Detect car names in the non-setting columns in one vectorized pass
+    cells = sheet_data[name_columns].astype(str).apply(lambda column: column.str.strip())
+    cells = cells.mask(cells.isin(SKIP_VALUES))
+    car_manufacturers = cells.apply(
+        lambda column: column.str.extract(CAR_NAME_RE, expand=False))
+
+    # Last car named on each row, if any
+    car_names = cells.where(car_manufacturers.notna()).ffill(axis=1).iloc[:, -1]
+    row_manufacturers = car_manufacturers.ffill(axis=1).iloc[:, -1]
+    car_rows = car_names.notna()
+
+    # Convert each setting column to numbers once; '--', blanks etc. become NaN
+    setting_values = sheet_data[list(setting_columns)].apply(
+        pd.to_numeric, errors='coerce').astype(float)
+    setting_values.columns = list(setting_columns.values())
+
+    # A car owns the rows from its name down to the next car. Later
+    # values win, so keep the last value of each setting in the block.
+    car_block = car_rows.cumsum()
+    owned = car_block > 0
+    block_values = setting_values[owned].groupby(car_block[owned]).last()
+
+    # Intern the repeated key strings so every car, sheet and cache load shares them
+    setting_names = [sys.intern(name) for name in block_values.columns]
+    for car, mfr_name, values in zip(car_names[car_rows], row_manufacturers[car_rows],
+                                     block_values.itertuples(index=False, name=None)):
+        settings = {name: value for name, value in zip(setting_names, values) if pd.notna(value)}
+        if settings:
+            cars.setdefault(sys.intern(mfr_name), {})[car] = settings
+
+    return cars
+
+@functools.lru_cache(maxsize=8)
+def _vehicle_sheet_names(settings_file: Path, file_key) -> Tuple[str, ...]:
+    """List the vehicle category sheets in a workbook, memoized per file version.
+
+    A CSV file holds a single category. It is listed under the file's name
+    (e.g. RACING.csv), but any category name reads it; see SettingsConverter._load_sheet.
+    """
+    if settings_file.suffix == '.csv':
+        return (settings_file.stem,)
+    with pd.ExcelFile(settings_file, engine=EXCEL_ENGINE) as workbook:
+        available = set(workbook.sheet_names)
+    return tuple(name for name in VALID_CATEGORIES if name in available)
+
+@functools.lru_cache(maxsize=32)
+def _load_vehicle_sheet(settings_file: Path, file_key, sheet_name: str) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Read and parse one vehicle sheet, memoized per file version."""
+    return _parse_sheet(_read_sheet(settings_file, sheet_name))
 
 class SettingsConverter:
     """Handles conversion of settings from Excel/CSV to AutoHotkey scripts."""
-    def __init__(self, settings_file: str):
+    def __init__(self, settings_file: str, use_cache: bool = True):
         self.settings_file = Path(settings_file)
+        self.use_cache = use_cache
         self._validate_file()
         self._load_data()
 
+    @classmethod
+    def from_dataframe(cls, sheet_data: pd.DataFrame, sheet_name: str = "Street") -> "SettingsConverter":
+        """Build a converter from an in-memory sheet, without reading a file."""
+        converter = cls.__new__(cls)
+        converter.settings_file = None
+        converter.use_cache = False
+        converter._file_key = None
+        converter.sheet_names = [sheet_name]
+        try:
+            converter.data = {sheet_name: _parse_sheet(sheet_data)}
+        except Exception as e:
+            raise ValueError(f"Error loading data: {str(e)}")
+        return converter
+
     def _validate_file(self):
         if not self.settings_file.exists():
             raise FileNotFoundError(f"Settings file not found: {self.settings_file}")
         if self.settings_file.suffix not in ['.xlsx', '.csv']:
             raise ValueError("Settings file must be .xlsx or .csv format")
 
+    @property
+    def cache_file(self) -> Path:
+        """Path of the parsed-data cache for the settings file."""
+        return self.settings_file.with_name(self.settings_file.name + CACHE_SUFFIX)
+
+    def _current_file_key(self):
+        """Key identifying the current contents of the settings file."""
+        stat = self.settings_file.stat()
+        return (CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+
+    def _load_cache(self) -> bool:
+        """Load sheet names and parsed sheets from the cache. Returns True on a cache hit.
+
+        The file is a JSON key line followed by a pickle. The key is checked
+        first, so stale or mismatched files are rejected without unpickling them.
+        """
+        try:
+            with open(self.cache_file, 'rb') as f:
+                if json.loads(f.readline(256)) != list(self._file_key):
+                    return False
+                sheet_names, data = pickle.load(f)
+        except Exception:
+            return False
+        self.sheet_names = sheet_names
+        self.data = data
+        return True
+
+    def _save_cache(self):
+        """Write parsed sheets to the cache, ignoring unwritable locations."""
+        if not self.use_cache:
+            return
+        try:
+            with open(self.cache_file, 'wb') as f:
+                f.write(json.dumps(self._file_key).encode() + b"\n")
+                pickle.dump((self.sheet_names, self.data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+
+    def _call(self, loader, *args):
+        """Call a memoized workbook loader, bypassing the memo when caching is off."""
+        if not self.use_cache:
+            loader = loader.__wrapped__
+        return loader(self.settings_file, self._file_key, *args)
+
     def _load_data(self):
-        """Load and validate data from the settings file."""
+        """Find the vehicle sheets in the settings file. Sheets are parsed on demand."""
+        self._file_key = self._current_file_key()
+        if self.use_cache and self._load_cache():
+            return
+
         try:
-            if self.settings_file.suffix == '.xlsx':
-                self.data = {}
-                df = pd.read_excel(self.settings_file, sheet_name=None)
-                
-                # Filter vehicle sheets
-                valid_categories = ['STREET TIER 1', 'STREET TIER 2', 'RACING', 'DRIFT', 
-                                  'RALLY', 'RALLY RAID', 'HYPERCAR', 'DRAGSTER', 'ALPHA', 
-                                  'DEMOLITION DERBY', 'MONSTER TRUCK', 'MOTO']
-                
-                # Setting column identifiers
-                setting_identifiers = {
-                    'Final Drive': 'final_drive',
-                    'Front Power Distrib': 'front_power_distrib',
-                    'Front Brake Balance': 'front_brake_balance',
-                    'Brake Power': 'brake_power',
-                    'Grip Front': 'grip_front',
-                    'Grip Rear': 'grip_rear',
-                    'Load Front': 'load_front',
-                    'Load Rear': 'load_rear',
-                    'Spring Front': 'spring_front',
-                    'Spring Rear': 'spring_rear',
-                    'Compression Front': 'compression_front',
-                    'Compression Rear': 'compression_rear',
-                    'Rebound Front': 'rebound_front',
-                    'Rebound Rear': 'rebound_rear',
-                    'ARB Front': 'arb_front',
-                    'ARB Rear': 'arb_rear',
-                    'Camber Front': 'camber_front',
-                    'Camber Rear': 'camber_rear'
-                }
-                
-                # Non-car values to skip
-                skip_values = {'nan', 'NaN', '--', '', 'WELCOME', 'SETTINGS', 'CAR NAME'}
-                
-                # Known manufacturers to check
-                manufacturers = {
-                    'BMW', 'AUDI', 'MERCEDES', 'PORSCHE', 'FORD', 'CHEVROLET',
-                    'DODGE', 'VOLKSWAGEN', 'MAZDA', 'NISSAN', 'HONDA', 'PLYMOUTH',
-                    'MITSUBISHI', 'PROTO', 'JAGUAR', 'ALFA ROMEO', 'DELOREAN',
-                    'BUICK', 'CADILLAC', 'FERRARI', 'HUMMER', 'JEEP', 'MASERATI',
-                    'MINI', 'PONTIAC', 'RENAULT', 'SHELBY', 'TOYOTA', 'ABARTH',
-                    'ASTON MARTIN', 'BUGATTI', 'CHRYSLER', 'LANCIA', 'LAND ROVER'
-                }
-                
-                for sheet_name in valid_categories:
-                    if sheet_name in df:
-                        sheet_data = df[sheet_name]
-                        self.data[sheet_name] = {}
-                        
-                        # Find setting columns
-                        setting_columns = {}
-                        for col in sheet_data.columns:
-                            col_str = str(col)
-                            if any(setting in col_str for setting in setting_identifiers.keys()):
-                                matched_setting = next(s for s in setting_identifiers.keys() if s in col_str)
-                                setting_columns[col] = setting_identifiers[matched_setting]
-                        
-                        # Process each row
-                        current_car = None
-                        current_settings = {}
-                        
-                        for idx, row in sheet_data.iterrows():
-                            # Check each column for car names or settings
-                            for col in sheet_data.columns:
-                                value = str(row[col]).strip()
-                                if not value or value in skip_values:
-                                    continue
-                                
-                                # Check if this is a car name
-                                for mfr in manufacturers:
-                                    if value.startswith(mfr):
-                                        # Skip manufacturer grouping rows that contain "/"
-                                        if "/" in value:
-                                            break
-                                            
-                                        # Found a car, save previous car's settings if any
-                                        if current_car and current_settings:
-                                            mfr_name = next(m for m in manufacturers if current_car.startswith(m))
-                                            if mfr_name not in self.data[sheet_name]:
-                                                self.data[sheet_name][mfr_name] = {}
-                                            self.data[sheet_name][mfr_name][current_car] = current_settings
-                                        
-                                        # Start new car
-                                        current_car = value
-                                        current_settings = {}
-                                        break
-                                
-                                # If this is a setting column, try to get the value
-                                if col in setting_columns:
-                                    try:
-                                        if value not in ['--', 'nan', 'NaN', '']:
-                                            setting_value = pd.to_numeric(value)
-                                            if pd.notna(setting_value):
-                                                current_settings[setting_columns[col]] = float(setting_value)
-                                    except:
-                                        continue
-                        
-                        # Save last car's settings
-                        if current_car and current_settings:
-                            mfr_name = next(m for m in manufacturers if current_car.startswith(m))
-                            if mfr_name not in self.data[sheet_name]:
-                                self.data[sheet_name][mfr_name] = {}
-                            self.data[sheet_name][mfr_name][current_car] = current_settings
-                
-                # Remove empty categories and manufacturers
-                for sheet_name in list(self.data.keys()):
-                    # Remove manufacturers with no models
-                    self.data[sheet_name] = {mfr: models 
-                                           for mfr, models in self.data[sheet_name].items() 
-                                           if models}
-                    # Remove empty sheets
-                    if not self.data[sheet_name]:
-                        del self.data[sheet_name]
-                
-                if not self.data:
-                    raise ValueError("No valid vehicle data found in the file")
-            else:
-                raise ValueError("Only Excel files are supported")
-                
+            self.sheet_names = list(self._call(_vehicle_sheet_names))
+            self.data = {}
+            
+            if not self.sheet_names:
+                raise ValueError("No valid vehicle data found in the file")
         except Exception as e:
             raise ValueError(f"Error loading data: {str(e)}")
 
+        self._save_cache()
+
+    def _load_sheet(self, sheet_name: str) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Parse a single vehicle sheet, caching the result."""
+        # A CSV file has no sheets, so the requested category is ignored
+        if self.settings_file is not None and self.settings_file.suffix == '.csv':
+            sheet_name = self.sheet_names[0]
+        
+        if sheet_name not in self.sheet_names:
+            raise ValueError(f"Category '{sheet_name}' not found")
+        
+        if sheet_name not in self.data:
+            try:
+                self.data[sheet_name] = self._call(_load_vehicle_sheet, sheet_name)
+            except Exception as e:
+                raise ValueError(f"Error loading data: {str(e)}")
+            self._save_cache()
+        
+        return self.data[sheet_name]
+
     def list_sheets(self):
         """List all available sheets/categories."""
-        return list(self.data.keys())
+        return list(self.sheet_names)
 
     def list_cars(self, sheet_name: str):
         """List all cars in a specific sheet/category."""
-        if sheet_name not in self.data:
-            raise ValueError(f"Category '{sheet_name}' not found")
+        cars = self._load_sheet(sheet_name)
         
         output_lines = []
-        for manufacturer in sorted(self.data[sheet_name].keys()):
+        for manufacturer in sorted(cars.keys()):
             if manufacturer not in ['UNKNOWN']:  # Skip unknown manufacturer category
-                models = self.data[sheet_name][manufacturer]
+                models = cars[manufacturer]
                 if models:  # Only show manufacturers that have models
                     output_lines.append(f"\n{manufacturer}")
                     for model in sorted(models.keys()):
@@ -355,19 +529,22 @@ class SettingsConverter:
 
     def get_car_setup(self, sheet_name: str, manufacturer: str, model: str) -> CarSetup:
         """Retrieve settings for a specific car."""
-        if sheet_name not in self.data:
-            raise ValueError(f"Category '{sheet_name}' not found")
+        cars = self._load_sheet(sheet_name)
         
-        if manufacturer not in self.data[sheet_name]:
+        if manufacturer not in cars:
             raise ValueError(f"Manufacturer '{manufacturer}' not found in category '{sheet_name}'")
             
-        if model not in self.data[sheet_name][manufacturer]:
+        if model not in cars[manufacturer]:
             raise ValueError(f"Model '{model}' not found for manufacturer '{manufacturer}' in category '{sheet_name}'")
         
-        return CarSetup(self.data[sheet_name][manufacturer][model])
+        return CarSetup(cars[manufacturer][model])
+
+def main(argv: Optional[List[str]] = None):
+    """Main entry point for the script.
 
-def main():
-    """Main entry point for the script."""
+    Args:
+        argv: Command line arguments; defaults to sys.argv[1:]
+    """
     parser = argparse.ArgumentParser(
         description="Convert car settings to AutoHotkey script",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
@@ -388,10 +565,12 @@ def main():
                       help="List all available vehicle categories")
     parser.add_argument("--list-cars", action="store_true",
                       help="List all available cars in the specified category")
+    parser.add_argument("--no-cache", action="store_true",
+                      help="Re-parse the settings file instead of using the cached data")
 
     try:
-        args = parser.parse_args()
-        converter = SettingsConverter(args.settings_file)
+        args = parser.parse_args(argv)
+        converter = SettingsConverter(args.settings_file, use_cache=not args.no_cache)
 
         if args.list_categories:
             print("\nAvailable vehicle categories:")
@@ -422,12 +601,12 @@ def main():
         setup = converter.get_car_setup(args.category, args.manufacturer, args.model)
         
         # Remove skipped settings
-        setup.settings = [s for s in setup.settings if s.name not in args.skip_settings]
+        skip_settings = frozenset(args.skip_settings)
+        setup.settings = [s for s in setup.settings if s.name not in skip_settings]
         
         # Generate and save script
-        script = setup.generate_ahk_script()
         with open(args.output, 'w') as f:
-            f.write(script)
+            setup.generate_ahk_script(out=f)
         
         print(f"\nAutoHotkey script generated successfully: {args.output}")
         print(f"Settings applied: {len(setup.settings)}")
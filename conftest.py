@@ -1,12 +1,13 @@
 import pytest
+import re
 import pandas as pd
-import tempfile
 from pathlib import Path
 import threading
-import time
+import tkinter as tk
 from typing import List
 from queue import Queue
-from ui_simulator import SimulatorInput, CLISimulator, GUISimulator
+import ui_simulator
+from ui_simulator import BaseSimulator, SimulatorInput, CLISimulator, GUISimulator
 
 class SimulationController:
     """Controls a simulator instance for testing."""
@@ -27,7 +28,7 @@ class SimulationController:
         self._simulator_thread = threading.Thread(target=run_simulator)
         self._simulator_thread.daemon = True
         self._simulator_thread.start()
-        time.sleep(0.5)  # Give simulator time to start
+        self.simulator.ready.wait(timeout=2)  # Wait until simulator accepts input
     
     def stop(self):
         """Stop the simulator."""
@@ -36,9 +37,18 @@ class SimulationController:
             self._simulator_thread.join(timeout=1)
     
     def send_input(self, input_type: SimulatorInput):
-        """Send input to the simulator."""
+        """Send input to the simulator. Input is processed and displayed before this returns."""
         self.simulator.handle_input(input_type)
-        time.sleep(0.1)  # Allow time for input processing
+        self.simulator.flush_ui()
+    
+    def send_inputs(self, inputs: List[SimulatorInput]):
+        """Send a batch of inputs, applied as one run per repeated input."""
+        self.simulator.handle_inputs(inputs)
+        self.simulator.flush_ui()
+    
+    def goto(self, name: str):
+        """Select a setting directly instead of sending Down until it is reached."""
+        self.simulator.goto(name)
     
     def get_current_setting(self):
         """Get the current setting state."""
@@ -47,16 +57,53 @@ class SimulationController:
     def is_running(self):
         """Check if simulator is still running."""
         return self.simulator.running
+    
+    def check_timeout(self):
+        """Run one timeout check now instead of waiting for the monitor thread."""
+        return self.simulator._tick()
+
+class FakeClock:
+    """Virtual clock for timeout tests; time only moves when advanced."""
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+    
+    def advance(self, seconds: float):
+        """Move the clock forward without sleeping."""
+        self.now += seconds
+
+# Key presses in a generated AHK script, e.g. "Send {Down}" or "Send {Right 15}"
+AHK_SEND_RE = re.compile(r'^\s*Send,?\s*\{(Up|Down|Left|Right)(?:\s+(\d+))?\}', re.MULTILINE)
+
+class FakeAhkRunner:
+    """Replays a generated AHK script's key presses into a simulator, in place of AutoHotkey.exe."""
+    def __init__(self, script: str, simulator: BaseSimulator):
+        self.script = script
+        self.simulator = simulator
+    
+    def inputs(self) -> List[SimulatorInput]:
+        """Key presses sent by the script, in order."""
+        return [SimulatorInput(key)
+                for key, count in AHK_SEND_RE.findall(self.script)
+                for _ in range(int(count or 1))]
+    
+    def run(self) -> bool:
+        """Send the script's key presses. Returns False if the simulator is not running."""
+        if not self.simulator.running:
+            return False
+        self.simulator.handle_inputs(self.inputs())
+        return True
 
 @pytest.fixture(scope="session")
 def test_data_dir(tmp_path_factory):
     """Create a temporary directory for test data"""
     return tmp_path_factory.mktemp("test_data")
 
-@pytest.fixture
-def complex_settings_excel(test_data_dir):
-    """Create an Excel file with multiple cars and settings"""
-    df = pd.DataFrame({
+def _complex_settings_df():
+    """Multiple cars and settings, shared by the complex_settings fixtures."""
+    return pd.DataFrame({
         'Car': ['Car1', 'Car2', 'Car3'],
         'Creator': ['Creator1', 'Creator2', 'Creator1'],
         'Final Drive': [0.05, -0.03, 0.02],
@@ -64,33 +111,82 @@ def complex_settings_excel(test_data_dir):
         'Grip Front': [0.3, 0.2, -0.1],
         'Grip Rear': [0.2, 0.1, -0.2]
     })
-    
+
+@pytest.fixture(scope="session")
+def complex_settings_excel(test_data_dir):
+    """Create an Excel file with multiple cars and settings, once per session"""
     file_path = test_data_dir / "complex_settings.xlsx"
-    df.to_excel(file_path, sheet_name='Street', index=False)
+    _complex_settings_df().to_excel(file_path, sheet_name='Street', index=False, engine='xlsxwriter')
     return str(file_path)
 
+@pytest.fixture(scope="session")
+def complex_settings_csv(test_data_dir):
+    """The same data as complex_settings_excel as CSV, for tests that don't need the xlsx path"""
+    file_path = test_data_dir / "complex_settings.csv"
+    _complex_settings_df().to_csv(file_path, index=False)
+    return str(file_path)
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Replace the simulator clock. Request it before the simulator fixtures."""
+    fake = FakeClock()
+    monkeypatch.setattr(ui_simulator, "clock", fake)
+    return fake
+
+SIMULATOR_SETTINGS = [
+    "final_drive",
+    "front_power_distrib",
+    "grip_front",
+    "front_brake_balance"
+]
+
+@pytest.fixture(scope="session")
+def _cli_template():
+    """CLI simulator built once per session, with a snapshot of its initial state."""
+    controller = SimulationController(CLISimulator, SIMULATOR_SETTINGS)
+    yield controller, controller.simulator.snapshot()
+    controller.stop()
+
+def pytest_collection_modifyitems(items):
+    """Mark every test that uses the GUI simulator with the gui marker."""
+    for item in items:
+        if "gui_simulator" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.gui)
+
+@pytest.fixture(scope="session")
+def _tk_available():
+    """Whether Tk can open a window here; False on headless machines."""
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return False
+    root.destroy()
+    return True
+
+@pytest.fixture(scope="session")
+def _gui_template(_tk_available):
+    """GUI simulator built once per session, with a snapshot of its initial state."""
+    if not _tk_available:
+        pytest.skip("Tk cannot open a display")
+    controller = SimulationController(GUISimulator, SIMULATOR_SETTINGS)
+    yield controller, controller.simulator.snapshot()
+    controller.stop()
+    controller.simulator.root.destroy()
+
 @pytest.fixture
-def cli_simulator():
-    """Fixture providing a CLI simulator controller."""
-    controller = SimulationController(CLISimulator, [
-        "final_drive",
-        "front_power_distrib",
-        "grip_front",
-        "front_brake_balance"
-    ])
+def cli_simulator(_cli_template):
+    """Fixture providing a CLI simulator controller, reset to its initial state."""
+    controller, initial_state = _cli_template
+    controller.simulator.restore(initial_state)
     controller.start()
     yield controller
     controller.stop()
 
 @pytest.fixture
-def gui_simulator():
-    """Fixture providing a GUI simulator controller."""
-    controller = SimulationController(GUISimulator, [
-        "final_drive",
-        "front_power_distrib",
-        "grip_front",
-        "front_brake_balance"
-    ])
+def gui_simulator(_gui_template):
+    """Fixture providing a GUI simulator controller, reset to its initial state."""
+    controller, initial_state = _gui_template
+    controller.simulator.restore(initial_state)
     controller.start()
     yield controller
     controller.stop()
@@ -1,6 +1,7 @@
 import pytest
+import io
+import functools
 import pandas as pd
-import tempfile
 from pathlib import Path
 from TCM_script_creator import CarSetting, CarSetup, SettingsConverter
 from TCM_script_creator import main
@@ -9,35 +10,65 @@ from unittest.mock import patch
 
 # test_TCM_script_creator.py
 
-@pytest.fixture
-def sample_excel():
-    """Create a temporary Excel file with test data"""
-    df = pd.DataFrame({
+@functools.lru_cache(maxsize=None)
+def _base_df():
+    """Canonical single-car test data. Shared; derive variants with assign/drop."""
+    return pd.DataFrame({
         'Car': ['Test Car'],
         'Creator': ['Test Creator'],
         'Final Drive': [0.05],
         'Front Power Distrib': [2],
         'Grip Front': [0.3]
     })
+
+@pytest.fixture(scope="session")
+def sample_excel(tmp_path_factory):
+    """Create an Excel file with test data, once per session"""
+    df = _base_df()
+    
+    file_path = tmp_path_factory.mktemp("sample") / "sample.xlsx"
+    df.to_excel(file_path, sheet_name='Street', index=False, engine='xlsxwriter')
+    return str(file_path)
+
+@pytest.fixture(scope="session")
+def sample_csv(tmp_path_factory):
+    """Create a CSV file with test data, once per session"""
+    df = pd.DataFrame({
+        'CAR NAME': ['BMW M3 SPORT'],
+        'Final Drive': [-5],
+        'Front Power Distrib': [45],
+        'Grip Front': [-3]
+    })
     
-    with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp:
-        df.to_excel(tmp.name, sheet_name='Street', index=False)
-        return tmp.name
+    file_path = tmp_path_factory.mktemp("sample") / "sample.csv"
+    df.to_csv(file_path, index=False)
+    return str(file_path)
+
+@pytest.fixture(scope="session")
+def converter(sample_excel):
+    """SettingsConverter for the sample Excel file, shared across tests"""
+    return SettingsConverter(sample_excel)
 
 @pytest.fixture
-def sample_csv():
-    """Create a temporary CSV file with test data"""
+def run_main():
+    """Run the CLI entry point with the given argv"""
+    def _run(args):
+        return main(args[1:])
+    return _run
+
+@pytest.fixture
+def vehicle_excel(tmp_path):
+    """Create an Excel file laid out like the community settings workbook"""
     df = pd.DataFrame({
-        'Car': ['Test Car'],
-        'Creator': ['Test Creator'],
-        'Final Drive': [0.05],
-        'Front Power Distrib': [2],
-        'Grip Front': [0.3]
+        'CAR NAME': ['BMW M3 SPORT', 'MAZDA RX-7'],
+        'Final Drive': [-5, '--'],
+        'Front Power Distrib': [45, 50],
+        'Grip Front': [-3, -2]
     })
     
-    with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as tmp:
-        df.to_csv(tmp.name, index=False)
-        return tmp.name
+    file_path = tmp_path / "vehicles.xlsx"
+    df.to_excel(file_path, sheet_name='RACING', index=False, engine='xlsxwriter')
+    return str(file_path)
 
 def test_car_setting_keystrokes():
     """Test CarSetting keystrokes generation"""
@@ -53,6 +84,15 @@ def test_car_setting_keystrokes():
     setting = CarSetting(name="test", value=0, increment=0.01, is_delta=True)
     assert setting.get_keystrokes() == []
 
+def test_car_setting_key_run():
+    """Test CarSetting key run matches its keystrokes"""
+    assert CarSetting(name="test", value=-0.03, increment=0.01, is_delta=True).key_run == ("Left", 3)
+    assert CarSetting(name="front_power_distrib", value=40, increment=1, is_delta=False).key_run == ("Right", 20)
+    assert CarSetting(name="test", value=0, increment=0.01, is_delta=True).key_run[1] == 0
+    
+    setting = CarSetting(name="test", value=0.05, increment=0.01, is_delta=True)
+    assert setting.key_run is setting.key_run  # Computed once
+
 def test_car_setup_script_generation():
     """Test CarSetup AHK script generation"""
     settings = {
@@ -63,12 +103,33 @@ def test_car_setup_script_generation():
     script = setup.generate_ahk_script()
     
     assert "#SingleInstance Force" in script
-    assert "Send {Right}" in script
+    assert "Send {Right 58}" in script  # 60% -> 2%
     assert "Settings applied!" in script
 
-def test_settings_converter(sample_excel):
+def test_script_batches_repeated_keys():
+    """Test that repeated presses use a single Send {Key N} line"""
+    script = CarSetup({"grip_front": -5, "grip_rear": 1}).generate_ahk_script()
+    assert "    Send {Left 5}" in script
+    assert "    Send {Right}" in script
+    assert "Send {Left}" not in script
+
+def test_car_setup_input_plan():
+    """Test that the input plan lists only settings that need key presses"""
+    setup = CarSetup({"final_drive": 0.05, "front_power_distrib": 2, "grip_front": -5})
+    assert setup.input_plan() == [
+        ("front_power_distrib", "Right", 58),
+        ("grip_front", "Left", 5),
+    ]
+
+def test_car_setup_script_streaming():
+    """Test writing the AHK script to a file object"""
+    setup = CarSetup({"final_drive": 0.05, "front_power_distrib": 2})
+    out = io.StringIO()
+    assert setup.generate_ahk_script(out=out) is None
+    assert out.getvalue() == setup.generate_ahk_script() + "\n"
+
+def test_settings_converter(converter):
     """Test SettingsConverter functionality"""
-    converter = SettingsConverter(sample_excel)
     setup = converter.get_car_setup("Street", "Test Car", "Test Creator")
     
     assert len(setup.settings) > 0
@@ -83,13 +144,12 @@ def test_invalid_file():
     with pytest.raises(ValueError):
         SettingsConverter("invalid.txt")
 
-def test_missing_car_settings(sample_excel):
+def test_missing_car_settings(converter):
     """Test handling of missing car settings"""
-    converter = SettingsConverter(sample_excel)
     with pytest.raises(ValueError):
         converter.get_car_setup("Street", "Nonexistent Car", "Test Creator")
 
-def test_integration(sample_excel, tmp_path):
+def test_integration(sample_excel, tmp_path, run_main):
     """Integration test using temporary files"""
     output_file = tmp_path / "test_setup.ahk"
     
@@ -103,11 +163,10 @@ def test_integration(sample_excel, tmp_path):
         "--output", str(output_file)
     ]
     
-    with patch.object(sys, 'argv', test_args):
-        assert main() == 0
-        assert output_file.exists()
-        content = output_file.read_text()
-        assert "#SingleInstance Force" in content
+    assert run_main(test_args) == 0
+    assert output_file.exists()
+    content = output_file.read_text()
+    assert "#SingleInstance Force" in content
 
 def test_setting_increments():
     """Test various setting increment values"""
@@ -127,12 +186,13 @@ def test_setting_increments():
             assert len(setting.get_keystrokes()) == 3
 
 def test_csv_support(sample_csv):
-    """Test CSV file support"""
+    """Test CSV file support; a CSV holds one category, so the category name is ignored"""
     converter = SettingsConverter(sample_csv)
-    setup = converter.get_car_setup("Street", "Test Car", "Test Creator")
-    assert len(setup.settings) > 0
+    setup = converter.get_car_setup("Street", "BMW", "BMW M3 SPORT")
+    assert setup.by_name["final_drive"].value == -5
+    assert converter.list_cars("RACING") == converter.list_cars("sample")
 
-def test_skip_settings(sample_excel):
+def test_skip_settings(sample_excel, tmp_path, run_main):
     """Test skipping specific settings"""
     test_args = [
         "script.py",
@@ -140,46 +200,38 @@ def test_skip_settings(sample_excel):
         "--sheet", "Street",
         "--car", "Test Car",
         "--creator", "Test Creator",
+        "--output", str(tmp_path / "skip_setup.ahk"),
         "--skip-settings", "final_drive", "grip_front"
     ]
     
-    with patch.object(sys, 'argv', test_args):
-        assert main() == 0
+    assert run_main(test_args) == 0
 
-def test_invalid_setting_values(sample_excel):
-    """Test handling of invalid setting values"""
+def test_invalid_setting_values():
+    """Test that non-numeric setting values are skipped rather than applied"""
     df = pd.DataFrame({
-        'Car': ['Invalid Car'],
-        'Creator': ['Test Creator'],
+        'CAR NAME': ['BMW M3 SPORT'],
         'Final Drive': ['invalid'],  # Invalid non-numeric value
-        'Front Power Distrib': [2],
-        'Grip Front': [0.3]
+        'Grip Front': [-3]
     })
     
-    with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp:
-        df.to_excel(tmp.name, sheet_name='Street', index=False)
-        converter = SettingsConverter(tmp.name)
-        with pytest.raises(ValueError):
-            converter.get_car_setup("Street", "Invalid Car", "Test Creator")
+    converter = SettingsConverter.from_dataframe(df, "RACING")
+    setup = converter.get_car_setup("RACING", "BMW", "BMW M3 SPORT")
+    assert "final_drive" not in setup.by_name
+    assert "final_drive" in setup.auto_skipped_settings
+    assert setup.by_name["grip_front"].value == -3
 
 def test_multiple_sheets(test_data_dir):
     """Test handling multiple sheets in Excel file"""
-    street_data = pd.DataFrame({
-        'Car': ['Street Car'],
-        'Creator': ['Test Creator'],
-        'Final Drive': [0.05],
-        'Front Power Distrib': [2]
-    })
+    street_data = _base_df().drop(columns='Grip Front').assign(Car=['Street Car'])
     
-    race_data = pd.DataFrame({
+    race_data = _base_df().drop(columns='Grip Front').assign(**{
         'Car': ['Race Car'],
-        'Creator': ['Test Creator'],
         'Final Drive': [0.07],
         'Front Power Distrib': [3]
     })
     
     file_path = test_data_dir / "multi_sheet.xlsx"
-    with pd.ExcelWriter(file_path) as writer:
+    with pd.ExcelWriter(file_path, engine='xlsxwriter') as writer:
         street_data.to_excel(writer, sheet_name='Street', index=False)
         race_data.to_excel(writer, sheet_name='Race', index=False)
     
@@ -190,7 +242,7 @@ def test_multiple_sheets(test_data_dir):
     assert any(s.value == 0.05 for s in street_setup.settings if s.name == "final_drive")
     assert any(s.value == 0.07 for s in race_setup.settings if s.name == "final_drive")
 
-def test_cli_arguments():
+def test_cli_arguments(run_main):
     """Test command line interface argument handling"""
     test_args = [
         "script.py",
@@ -200,16 +252,15 @@ def test_cli_arguments():
         "--creator", "Test Creator"
     ]
     
-    with patch.object(sys, 'argv', test_args):
-        assert main() == 1  # Should return error code 1
+    assert run_main(test_args) == 1  # Should return error code 1
     
     test_args = [
         "script.py",
         "--invalid-arg", "value"  # Invalid argument
     ]
     
-    with patch.object(sys, 'argv', test_args), pytest.raises(SystemExit):
-        main()
+    with pytest.raises(SystemExit):
+        run_main(test_args)
 
 def test_complex_script_generation(complex_settings_excel):
     """Test script generation with complex settings"""
@@ -229,6 +280,11 @@ def test_complex_script_generation(complex_settings_excel):
         if keystrokes:
             assert f"; Adjusting {setting.name}" in script
 
+def test_complex_settings_csv_matches_excel(complex_settings_excel, complex_settings_csv):
+    """Test that the CSV sibling of the complex workbook holds the same rows"""
+    expected = pd.read_excel(complex_settings_excel, dtype=str)
+    pd.testing.assert_frame_equal(pd.read_csv(complex_settings_csv, dtype=str), expected)
+
 def test_non_zero_default_settings():
     """Test settings that have non-zero default values"""
     # Test front_power_distrib (60% to 20% range)
@@ -236,22 +292,20 @@ def test_non_zero_default_settings():
         "front_power_distrib": 40  # Target value
     }
     setup = CarSetup(settings)
-    setting = next(s for s in setup.settings if s.name == "front_power_distrib")
-    keystrokes = setting.get_keystrokes()
+    setting = setup.by_name["front_power_distrib"]
     # Should move right 20 times (60 -> 40)
-    assert len(keystrokes) == 20
-    assert all(k == "Right" for k in keystrokes)
+    assert setting.keystroke_count == 20
+    assert setting.direction == "Right"
 
     # Test front_brake_balance (80% to 40% range)
     settings = {
         "front_brake_balance": 60  # Target value
     }
     setup = CarSetup(settings)
-    setting = next(s for s in setup.settings if s.name == "front_brake_balance")
-    keystrokes = setting.get_keystrokes()
+    setting = setup.by_name["front_brake_balance"]
     # Should move right 20 times (80 -> 60)
-    assert len(keystrokes) == 20
-    assert all(k == "Right" for k in keystrokes)
+    assert setting.keystroke_count == 20
+    assert setting.direction == "Right"
 
 def test_camber_increments():
     """Test camber settings that change in 0.01 increments"""
@@ -261,17 +315,14 @@ def test_camber_increments():
     }
     setup = CarSetup(settings)
     
-    front_setting = next(s for s in setup.settings if s.name == "camber_front")
-    rear_setting = next(s for s in setup.settings if s.name == "camber_rear")
+    front_setting = setup.by_name["camber_front"]
+    rear_setting = setup.by_name["camber_rear"]
     
-    front_keystrokes = front_setting.get_keystrokes()
-    rear_keystrokes = rear_setting.get_keystrokes()
+    assert front_setting.keystroke_count == 5
+    assert front_setting.direction == "Right"
     
-    assert len(front_keystrokes) == 5
-    assert all(k == "Right" for k in front_keystrokes)
-    
-    assert len(rear_keystrokes) == 3
-    assert all(k == "Left" for k in rear_keystrokes)
+    assert rear_setting.keystroke_count == 3
+    assert rear_setting.direction == "Left"
 
 def test_mixed_settings():
     """Test a combination of different setting types"""
@@ -284,27 +335,23 @@ def test_mixed_settings():
     setup = CarSetup(settings)
     
     # Check power distribution
-    power_setting = next(s for s in setup.settings if s.name == "front_power_distrib")
-    power_keystrokes = power_setting.get_keystrokes()
-    assert len(power_keystrokes) == 30  # 60->30 = 30 steps
+    power_setting = setup.by_name["front_power_distrib"]
+    assert power_setting.keystroke_count == 30  # 60->30 = 30 steps
     
     # Check brake balance
-    brake_setting = next(s for s in setup.settings if s.name == "front_brake_balance")
-    brake_keystrokes = brake_setting.get_keystrokes()
-    assert len(brake_keystrokes) == 30  # 80->50 = 30 steps
+    brake_setting = setup.by_name["front_brake_balance"]
+    assert brake_setting.keystroke_count == 30  # 80->50 = 30 steps
     
     # Check camber
-    camber_setting = next(s for s in setup.settings if s.name == "camber_front")
-    camber_keystrokes = camber_setting.get_keystrokes()
-    assert len(camber_keystrokes) == 2  # 0.02/0.01 = 2 steps
+    camber_setting = setup.by_name["camber_front"]
+    assert camber_setting.keystroke_count == 2  # 0.02/0.01 = 2 steps
     
     # Check grip
-    grip_setting = next(s for s in setup.settings if s.name == "grip_front")
-    grip_keystrokes = grip_setting.get_keystrokes()
-    assert len(grip_keystrokes) == 5
-    assert all(k == "Left" for k in grip_keystrokes)
+    grip_setting = setup.by_name["grip_front"]
+    assert grip_setting.keystroke_count == 5
+    assert grip_setting.direction == "Left"
 
-def test_auto_skip_settings(test_data_dir):
+def test_auto_skip_settings(tmp_path):
     """Test automatic skipping of unavailable settings"""
     df = pd.DataFrame({
         'Car': ['Test Car'],
@@ -318,8 +365,8 @@ def test_auto_skip_settings(test_data_dir):
         'Camber Front': [0.05]             # Should be included
     })
     
-    file_path = test_data_dir / "skip_settings.xlsx"
-    df.to_excel(file_path, sheet_name='Street', index=False)
+    file_path = tmp_path / "Street.csv"
+    df.to_csv(file_path, index=False)
     
     converter = SettingsConverter(str(file_path))
     setup = converter.get_car_setup("Street", "Test Car", "Test Creator")
@@ -336,11 +383,11 @@ def test_auto_skip_settings(test_data_dir):
     
     # Generate script and verify structure
     script = setup.generate_ahk_script()
-    script_lines = script.split('\n')
+    line_index = {line.strip(): i for i, line in enumerate(script.splitlines())}
     
     # Check that skipped settings are documented in comments
-    assert "; Auto-skipped settings (not available for this car):" in script_lines
-    assert any("; - final_drive" in line for line in script_lines)
+    assert "; Auto-skipped settings (not available for this car):" in line_index
+    assert "; - final_drive" in line_index
     
     # Count Down keystrokes - should be 2 (between the 3 available settings)
     down_count = script.count("Send {Down}")
@@ -356,23 +403,143 @@ def test_skipped_settings_script_flow():
     setup = CarSetup(settings)
     
     script = setup.generate_ahk_script()
-    script_lines = script.split('\n')
+    line_index = {line.strip(): i for i, line in enumerate(script.splitlines())}
     
     # Verify only two Down commands (between the three settings)
     down_count = script.count("Send {Down}")
     assert down_count == 2
     
     # Verify order of operations
-    power_index = next(i for i, line in enumerate(script_lines) 
-                      if "; Adjusting front_power_distrib" in line)
-    arb_index = next(i for i, line in enumerate(script_lines) 
-                    if "; Adjusting arb_front" in line)
-    camber_index = next(i for i, line in enumerate(script_lines) 
-                       if "; Adjusting camber_rear" in line)
+    power_index = line_index["; Adjusting front_power_distrib (from 60%)"]
+    arb_index = line_index["; Adjusting arb_front"]
+    camber_index = line_index["; Adjusting camber_rear"]
     
     assert power_index < arb_index < camber_index  # Correct order
     
     # Verify intermediate settings are listed as skipped
-    skipped_settings = [line.strip() for line in script_lines 
-                       if line.strip().startswith("; - ")]
-    assert len(skipped_settings) > 10  # Should have many skipped settings
\ No newline at end of file
+    skipped_settings = [line for line in line_index if line.startswith("; - ")]
+    assert len(skipped_settings) > 10  # Should have many skipped settings
+
+def test_vehicle_workbook_parsing(vehicle_excel):
+    """Test parsing cars grouped by manufacturer"""
+    converter = SettingsConverter(vehicle_excel)
+    assert converter.list_sheets() == ['RACING']
+    
+    setup = converter.get_car_setup("RACING", "BMW", "BMW M3 SPORT")
+    values = {s.name: s.value for s in setup.settings}
+    assert values == {"final_drive": -5, "front_power_distrib": 45, "grip_front": -3}
+    
+    setup = converter.get_car_setup("RACING", "MAZDA", "MAZDA RX-7")
+    assert "final_drive" in setup.auto_skipped_settings
+
+def test_csv_vehicle_file(vehicle_excel, tmp_path):
+    """Test that a CSV file is read as a single category named after the file"""
+    csv_path = tmp_path / "RACING.csv"
+    pd.read_excel(vehicle_excel).to_csv(csv_path, index=False)
+    
+    converter = SettingsConverter(str(csv_path))
+    assert converter.list_sheets() == ["RACING"]
+    assert converter.list_cars("RACING") == SettingsConverter(vehicle_excel).list_cars("RACING")
+
+def test_converter_from_dataframe(vehicle_excel):
+    """Test building a converter from an in-memory sheet"""
+    converter = SettingsConverter.from_dataframe(pd.read_excel(vehicle_excel), "RACING")
+    assert converter.list_sheets() == ["RACING"]
+    assert converter.list_cars("RACING") == SettingsConverter(vehicle_excel).list_cars("RACING")
+    
+    setup = converter.get_car_setup("RACING", "BMW", "BMW M3 SPORT")
+    assert {s.name: s.value for s in setup.settings}["front_power_distrib"] == 45
+
+def test_openpyxl_fallback(vehicle_excel):
+    """Test streaming sheets with openpyxl when calamine is unavailable"""
+    expected = SettingsConverter(vehicle_excel, use_cache=False)
+    expected.list_cars("RACING")
+    
+    with patch("TCM_script_creator.EXCEL_ENGINE", "openpyxl"):
+        converter = SettingsConverter(vehicle_excel, use_cache=False)
+        converter.list_cars("RACING")
+    assert converter.data == expected.data
+
+def test_openpyxl_fallback_duplicate_columns(tmp_path):
+    """Test that repeated column names parse the same with openpyxl as with pandas"""
+    df = pd.DataFrame([['BMW M3 SPORT', -5, -4, 45]],
+                      columns=['CAR NAME', 'Final Drive', 'Final Drive', 'Front Power Distrib'])
+    file_path = tmp_path / "duplicates.xlsx"
+    df.to_excel(file_path, sheet_name='RACING', index=False, engine='xlsxwriter')
+    
+    expected = SettingsConverter(str(file_path), use_cache=False)
+    expected.list_cars("RACING")
+    
+    with patch("TCM_script_creator.EXCEL_ENGINE", "openpyxl"):
+        converter = SettingsConverter(str(file_path), use_cache=False)
+        converter.list_cars("RACING")
+    assert converter.data == expected.data
+    assert converter.data["RACING"]["BMW"]["BMW M3 SPORT"]["final_drive"] == -4
+
+def test_parsed_data_cache(vehicle_excel):
+    """Test that parsed workbook data is cached and reused"""
+    converter = SettingsConverter(vehicle_excel)
+    cars = converter.list_cars("RACING")
+    assert converter.cache_file.exists()
+    
+    with patch("TCM_script_creator._read_sheet", side_effect=AssertionError("re-parsed")):
+        cached = SettingsConverter(vehicle_excel)
+        assert cached.list_cars("RACING") == cars
+        with pytest.raises(ValueError):
+            SettingsConverter(vehicle_excel, use_cache=False).list_cars("RACING")
+    assert cached.data == converter.data
+
+def test_parsed_sheets_shared_in_process(vehicle_excel):
+    """Test that converters for the same file share parsed sheets"""
+    first = SettingsConverter(vehicle_excel)
+    first.list_cars("RACING")
+    first.cache_file.unlink()
+    
+    with patch("TCM_script_creator._read_sheet", side_effect=AssertionError("re-parsed")):
+        second = SettingsConverter(vehicle_excel)
+        assert second.list_cars("RACING") == first.list_cars("RACING")
+
+def test_sheets_parsed_on_demand(vehicle_excel):
+    """Test that only requested sheets are parsed"""
+    converter = SettingsConverter(vehicle_excel, use_cache=False)
+    assert converter.data == {}
+    
+    converter.get_car_setup("RACING", "BMW", "BMW M3 SPORT")
+    assert list(converter.data) == ["RACING"]
+    
+    with pytest.raises(ValueError):
+        converter.list_cars("DRIFT")
+
+def test_parsed_data_cache_checks_key_before_unpickling(vehicle_excel):
+    """Test that a cache file whose key line doesn't match is never unpickled"""
+    converter = SettingsConverter(vehicle_excel)
+    converter.list_cars("RACING")
+    body = converter.cache_file.read_bytes().split(b"\n", 1)[1]
+    converter.cache_file.write_bytes(b'[0, 0, 0]\n' + body)
+    
+    with patch("TCM_script_creator.pickle.load") as load:
+        assert SettingsConverter(vehicle_excel).list_cars("RACING") == converter.list_cars("RACING")
+    load.assert_not_called()
+
+def test_parsed_data_cache_invalidation(vehicle_excel):
+    """Test that the cache is ignored once the workbook changes"""
+    SettingsConverter(vehicle_excel)
+    df = pd.DataFrame({'CAR NAME': ['AUDI R8'], 'Final Drive': [-2]})
+    df.to_excel(vehicle_excel, sheet_name='RACING', index=False, engine='xlsxwriter')
+    
+    converter = SettingsConverter(vehicle_excel)
+    assert converter.list_cars("RACING") == ["\nAUDI", "  - AUDI R8"]
+
+def test_manufacturer_grouping_rows(tmp_path):
+    """Test that manufacturer grouping rows are not treated as cars"""
+    df = pd.DataFrame({
+        'CAR NAME': ['BMW / MINI', 'BMW M3 SPORT', 'MINI COOPER S'],
+        'Final Drive': ['--', -5, -2]
+    })
+    file_path = tmp_path / "grouped.xlsx"
+    df.to_excel(file_path, sheet_name='STREET TIER 1', index=False, engine='xlsxwriter')
+    
+    converter = SettingsConverter(str(file_path))
+    assert converter.list_cars("STREET TIER 1") == [
+        "\nBMW", "  - BMW M3 SPORT", "\nMINI", "  - MINI COOPER S"
+    ]
@@ -0,0 +1,27 @@
+import pytest
+from ui_simulator import SimulatorInput
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark
+
+def test_bench_send_inputs(benchmark, cli_simulator):
+    """Benchmark applying a batch of repeated inputs."""
+    inputs = [SimulatorInput.RIGHT] * 50 + [SimulatorInput.LEFT] * 50
+    benchmark(cli_simulator.send_inputs, inputs)
+    assert cli_simulator.is_running()
+
+def test_bench_goto(benchmark, cli_simulator):
+    """Benchmark jumping straight to a setting."""
+    benchmark(cli_simulator.goto, "front_brake_balance")
+    assert cli_simulator.get_current_setting().name == "front_brake_balance"
+
+def test_bench_get_current_setting(benchmark, cli_simulator):
+    """Benchmark looking up the current setting."""
+    current = benchmark(cli_simulator.get_current_setting)
+    assert current.name == "final_drive"
+
+def test_bench_display_format(benchmark, cli_simulator):
+    """Benchmark formatting the current setting for display."""
+    text = benchmark(cli_simulator.simulator._format_current_setting)
+    assert text == "final_drive: 0.00%"
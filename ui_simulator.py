@@ -3,84 +3,119 @@ import threading
 import time
 import enum
 import csv
+import functools
+import itertools
 import json
+import pickle
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 import tkinter as tk
 from tkinter import ttk
 
+# Clock used for input and session timeouts; tests swap in a virtual clock
+clock = time.monotonic
+
+# Parsed setting ranges, stored next to the CSV as trusted local state: a JSON
+# key line is checked before the pickle body is loaded
+RANGES_CACHE_SUFFIX = ".cache.pkl"
+RANGES_CACHE_VERSION = 3  # Bump when SettingRange or the parsing changes
+
+# Settings whose value goes down when Right is pressed
+INVERTED_SETTINGS = frozenset({"front_power_distrib", "front_brake_balance"})
+
 class SimulatorInput(enum.Enum):
     UP = "Up"
     DOWN = "Down"
     LEFT = "Left"
     RIGHT = "Right"
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10; older versions fall back to a __dict__
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SettingRange:
     min_value: float
     max_value: float
     increment: float
     default_value: float = 0.0
     description: str = ""
+    
+    def clamp(self, value: float) -> float:
+        """Clamp value to the range; min_value wins if the bounds are reversed."""
+        if value > self.max_value:
+            value = self.max_value
+        if value < self.min_value:
+            value = self.min_value
+        return value
+
+@functools.lru_cache(maxsize=1024)
+def format_percent(value: float) -> str:
+    """Format a setting value as a percentage; settings only take a few hundred distinct values."""
+    return f"{value:.2%}"
+
+class SliderState(NamedTuple):
+    """What one setting's slider widgets currently show."""
+    value: float
+    from_: float
+    to: float
+    text: str
+    highlighted: bool
 
 class ProSetting:
+    __slots__ = ("name", "range", "current_value", "_sign")
+    
     def __init__(self, name: str, setting_range: SettingRange):
         self.name = name
         self.range = setting_range
-        self._current_value = setting_range.default_value
-    
-    @property
-    def current_value(self) -> float:
-        return self._current_value
-    
-    @current_value.setter
-    def current_value(self, value: float):
-        # Clamp value to valid range
-        self._current_value = max(
-            self.range.min_value,
-            min(self.range.max_value, value)
-        )
+        self.current_value = setting_range.default_value
+        self._sign = -1 if name in INVERTED_SETTINGS else 1
     
     def adjust(self, direction: SimulatorInput) -> bool:
         """Adjust setting value based on input. Returns True if value changed."""
+        return self.adjust_by(direction, 1)
+    
+    def adjust_by(self, direction: SimulatorInput, count: int) -> bool:
+        """Apply count presses of one direction as a single clamped step. Returns True if value changed."""
         if direction not in (SimulatorInput.LEFT, SimulatorInput.RIGHT):
             return False
             
         old_value = self.current_value
-        new_value = old_value
-        
-        if direction == SimulatorInput.RIGHT:
-            # Moving right decreases value for some settings
-            if self.name in ("front_power_distrib", "front_brake_balance"):
-                new_value = old_value - self.range.increment
-            else:
-                new_value = old_value + self.range.increment
-        else:
-            # Moving left increases value for some settings
-            if self.name in ("front_power_distrib", "front_brake_balance"):
-                new_value = old_value + self.range.increment
-            else:
-                new_value = old_value - self.range.increment
+        # Right increases the value, except on inverted settings where it decreases it
+        sign = self._sign if direction == SimulatorInput.RIGHT else -self._sign
         
-        self.current_value = new_value  # This will clamp to valid range
+        self.current_value = self.range.clamp(old_value + sign * self.range.increment * count)
         return old_value != self.current_value
 
 class SimulatorState:
     def __init__(self, settings: List[ProSetting]):
         self.settings = settings
         self.current_setting_index = 0
-        self.last_input_time = time.time()
-        self.start_time = time.time()
+        self._index_by_name = {s.name: i for i, s in enumerate(settings)}
+        self.last_input_time = clock()
+        self.start_time = self.last_input_time
+    
+    @property
+    def current_setting_index(self) -> int:
+        return self._index
+    
+    @current_setting_index.setter
+    def current_setting_index(self, index: int):
+        # Keep the selected setting alongside the index so lookups skip the list
+        self._index = index
+        self._current = self.settings[index] if self.settings else None
         
     def get_current_setting(self) -> Optional[ProSetting]:
-        if not self.settings:
-            return None
-        return self.settings[self.current_setting_index]
+        return self._current
         
+    def goto(self, name: str):
+        """Select a setting by name without stepping through the list."""
+        self.current_setting_index = self._index_by_name[name]
+    
     def handle_input(self, input_type: SimulatorInput) -> bool:
         """Handle input and return True if state changed."""
-        self.last_input_time = time.time()
+        self.last_input_time = clock()
         
         if input_type == SimulatorInput.UP:
             if self.current_setting_index > 0:
@@ -96,64 +131,118 @@ class SimulatorState:
                 return current_setting.adjust(input_type)
         return False
     
+    def handle_inputs(self, inputs: Iterable[SimulatorInput]) -> bool:
+        """Handle a sequence of inputs, applying each run of repeats at once.
+        
+        Returns True if state changed.
+        """
+        self.last_input_time = clock()
+        changed = False
+        
+        for input_type, run in itertools.groupby(inputs):
+            count = sum(1 for _ in run)
+            if input_type in (SimulatorInput.UP, SimulatorInput.DOWN):
+                offset = -count if input_type == SimulatorInput.UP else count
+                new_index = max(0, min(len(self.settings) - 1, self.current_setting_index + offset))
+                if new_index != self.current_setting_index:
+                    self.current_setting_index = new_index
+                    changed = True
+            else:
+                current_setting = self.get_current_setting()
+                if current_setting and current_setting.adjust_by(input_type, count):
+                    changed = True
+        return changed
+    
     def is_timed_out(self) -> Tuple[bool, str]:
-        current_time = time.time()
+        current_time = clock()
         if current_time - self.last_input_time > 10:
             return True, "No input received for 10 seconds"
         if current_time - self.start_time > 30:
             return True, "UI open for more than 30 seconds"
         return False, ""
+    
+    def time_until_timeout(self) -> float:
+        """Seconds until the earlier of the two timeouts is reached."""
+        current_time = clock()
+        return min(10 - (current_time - self.last_input_time),
+                   30 - (current_time - self.start_time))
 
+@functools.lru_cache(maxsize=1)
 def load_setting_ranges() -> Dict[str, SettingRange]:
-    """Load setting ranges from CSV file."""
+    """Load setting ranges from CSV file.
+
+    The result is cached; call load_setting_ranges.cache_clear() to re-read the CSV.
+    Parsed ranges are also pickled next to the CSV and reused until it changes.
+    """
     settings_file = Path(__file__).parent / "pro_settings_description.csv"
+    stat = settings_file.stat()
+    file_key = [RANGES_CACHE_VERSION, stat.st_mtime_ns, stat.st_size]
+    cache_file = settings_file.with_name(settings_file.name + RANGES_CACHE_SUFFIX)
+    
+    try:
+        with open(cache_file, 'rb') as f:
+            if json.loads(f.readline(256)) == file_key:
+                return pickle.load(f)
+    except Exception:
+        pass
+    
+    ranges = _parse_setting_ranges(settings_file)
+    try:
+        with open(cache_file, 'wb') as f:
+            f.write(json.dumps(file_key).encode() + b"\n")
+            pickle.dump(ranges, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return ranges
+
+def _parse_setting_ranges(settings_file: Path) -> Dict[str, SettingRange]:
+    """Parse setting ranges from the CSV file."""
     ranges = {}
     
-    with open(settings_file, newline='', encoding='utf-8-sig') as csvfile:
-        # Read first line to get column names
-        first_line = csvfile.readline().strip()
-        column_names = [col.strip() for col in first_line.split(',')]
-        settings_column = next(col for col in column_names if 'Pro Settings' in col)
-        
-        # Reset file pointer and create reader
-        csvfile.seek(0)
-        reader = csv.DictReader(csvfile)
-        
-        for row in reader:
-            try:
-                name = row[settings_column].lower().replace(" ", "_")
-                range_str = row['Possible Values'].strip()
-                desc = row['Description'].strip()
-                
-                # Parse range string (e.g., "-20% to 0%")
-                min_str, max_str = range_str.split(" to ")
-                min_val = float(min_str.strip("%")) / 100
-                max_val = float(max_str.strip("%")) / 100
-                
-                # Set defaults for special cases
-                default = 0.0
-                if name == "power_distribution":
-                    name = "front_power_distrib"  # Normalize name
-                    default = 0.4  # 40%
-                elif name == "brake_balance":
-                    name = "front_brake_balance"  # Normalize name
-                    default = 0.4  # 40%
-                
-                # Set increment
-                increment = 0.01  # 1% for most settings
-                if name in ("camber_front", "camber_rear"):
-                    increment = 0.01  # Special increment for camber
-                
-                ranges[name] = SettingRange(
-                    min_value=min_val,
-                    max_value=max_val,
-                    increment=increment,
-                    default_value=default,
-                    description=desc
-                )
-            except (ValueError, KeyError) as e:
-                print(f"Warning: Could not parse setting {name if 'name' in locals() else 'unknown'}: {str(e)}")
-                continue
+    # Read the file once; csv.reader on the lines still handles quoted descriptions
+    rows = csv.reader(settings_file.read_text(encoding='utf-8-sig').splitlines())
+    header = [col.strip() for col in next(rows)]
+    settings_col = next(i for i, col in enumerate(header) if 'Pro Settings' in col)
+    range_col = header.index('Possible Values')
+    desc_col = header.index('Description')
+    
+    for row in rows:
+        if not row:
+            continue
+        try:
+            name = row[settings_col].lower().replace(" ", "_")
+            range_str = row[range_col].strip()
+            desc = row[desc_col].strip()
+            
+            # Parse range string (e.g., "-20% to 0%")
+            min_str, max_str = range_str.split(" to ")
+            min_val = float(min_str.strip("%")) / 100
+            max_val = float(max_str.strip("%")) / 100
+            
+            # Set defaults for special cases
+            default = 0.0
+            if name == "power_distribution":
+                name = "front_power_distrib"  # Normalize name
+                default = 0.4  # 40%
+            elif name == "brake_balance":
+                name = "front_brake_balance"  # Normalize name
+                default = 0.4  # 40%
+            
+            # Set increment
+            increment = 0.01  # 1% for most settings
+            if name in ("camber_front", "camber_rear"):
+                increment = 0.01  # Special increment for camber
+            
+            ranges[name] = SettingRange(
+                min_value=min_val,
+                max_value=max_val,
+                increment=increment,
+                default_value=default,
+                description=desc
+            )
+        except (ValueError, IndexError) as e:
+            print(f"Warning: Could not parse setting {name if 'name' in locals() else 'unknown'}: {str(e)}")
+            continue
     
     if not ranges:
         raise ValueError("No valid settings found in CSV file")
@@ -163,7 +252,7 @@ def load_setting_ranges() -> Dict[str, SettingRange]:
 class BaseSimulator:
     """Base class for both UI and CLI simulators."""
     def __init__(self, available_settings: List[str]):
-        self.ranges = load_setting_ranges()
+        self.ranges = dict(load_setting_ranges())
         self.settings = []
         
         # Create settings based on available ones
@@ -174,37 +263,60 @@ class BaseSimulator:
         
         self.state = SimulatorState(self.settings)
         self.running = False
+        self.ready = threading.Event()  # Set once the simulator accepts input
         self._timeout_thread = None
-        self._timeout_lock = threading.Lock()
+        self._stop_event = threading.Event()  # Wakes the timeout thread on stop
+        self._show_display = sys.stdout.isatty()  # Nobody reads redirected status lines
     
     def start(self):
         """Start the simulator and timeout monitoring."""
-        with self._timeout_lock:
-            self.running = True
-            self._timeout_thread = threading.Thread(target=self._check_timeout)
-            self._timeout_thread.daemon = True
-            self._timeout_thread.start()
+        self.running = True
+        self._stop_event.clear()
+        self._timeout_thread = threading.Thread(target=self._check_timeout)
+        self._timeout_thread.daemon = True
+        self._timeout_thread.start()
+        self._on_start()
+        self.ready.set()
+    
+    def _on_start(self):
+        """Start subclass workers before the simulator is marked ready."""
+        pass
     
     def stop(self):
         """Stop the simulator."""
-        with self._timeout_lock:
-            if self.running:
-                self.running = False
-                if self._timeout_thread and self._timeout_thread.is_alive():
-                    self._timeout_thread.join(timeout=1)
+        self.running = False
+        self._stop_event.set()
+        self.ready.clear()
+        if self._timeout_thread and self._timeout_thread.is_alive():
+            self._timeout_thread.join(timeout=1)
+    
+    def snapshot(self):
+        """Capture the current setting index and values."""
+        return self.state.current_setting_index, [s.current_value for s in self.settings]
+    
+    def restore(self, snapshot):
+        """Return to a snapshot() and restart the timeout clocks."""
+        index, values = snapshot
+        self.state.current_setting_index = index
+        for setting, value in zip(self.settings, values):
+            setting.current_value = value
+        self.state.last_input_time = self.state.start_time = clock()
     
     def _check_timeout(self):
-        """Monitor for timeouts."""
-        while self.running:
-            with self._timeout_lock:
-                if not self.running:
-                    break
-                is_timeout, reason = self.state.is_timed_out()
-                if is_timeout:
-                    print(f"Timeout: {reason}")
-                    self.handle_timeout(reason)
-                    break
-            time.sleep(0.1)
+        """Monitor for timeouts, sleeping until the next deadline or stop()."""
+        while not self._tick():
+            # Inputs only push the deadline later, so waking early just re-checks.
+            self._stop_event.wait(max(self.state.time_until_timeout(), 0.01))
+    
+    def _tick(self) -> bool:
+        """Check for a timeout once. Returns True once the simulator has stopped."""
+        if not self.running:
+            return True
+        is_timeout, reason = self.state.is_timed_out()
+        if is_timeout:
+            print(f"Timeout: {reason}")
+            self.handle_timeout(reason)
+        return is_timeout
     
     def handle_input(self, input_type: SimulatorInput):
         """Handle input in the simulator."""
@@ -212,16 +324,38 @@ class BaseSimulator:
             return False
         return self.state.handle_input(input_type)
     
+    def handle_inputs(self, inputs: Iterable[SimulatorInput]):
+        """Handle a batch of inputs in the simulator."""
+        if not self.running:
+            return False
+        return self.state.handle_inputs(inputs)
+    
+    def goto(self, name: str):
+        """Jump straight to a setting, bypassing input handling."""
+        self.state.goto(name)
+    
     def handle_timeout(self, reason: str):
         """Handle timeout event."""
-        with self._timeout_lock:
-            self.running = False
+        self.running = False
+        self._stop_event.set()
     
-    def _display_current_setting(self):
-        """Display the current setting state."""
+    def flush_ui(self):
+        """Apply any display updates that are still pending."""
+    
+    def _format_current_setting(self) -> str:
+        """Format the current setting for display, or "" if there is none."""
         current = self.state.get_current_setting()
-        if current:
-            print(f"\r{current.name}: {current.current_value:.2%} ", end="")
+        if not current:
+            return ""
+        return f"{current.name}: {format_percent(current.current_value)}"
+    
+    def _display_current_setting(self):
+        """Display the current setting state on the terminal."""
+        if not self._show_display:
+            return
+        text = self._format_current_setting()
+        if text:
+            print(f"\r{text} ", end="")
 
 class GUISimulator(BaseSimulator):
     """GUI version of the simulator."""
@@ -230,6 +364,11 @@ class GUISimulator(BaseSimulator):
         self.root = tk.Tk()
         self.root.title("TCM Settings Simulator")
         
+        # Settings whose widgets need repainting at the next idle
+        self._dirty = set()
+        self._refresh_lock = threading.Lock()
+        self._flush_scheduled = False
+        
         # Setup ttk styles
         self.style = ttk.Style()
         self.style.configure("TFrame", background="white")
@@ -254,7 +393,7 @@ class GUISimulator(BaseSimulator):
             label.grid(row=0, column=0, padx=5)
             
             # For power_distrib and brake_balance, flip min/max for intuitive slider direction
-            if setting.name in ("front_power_distrib", "front_brake_balance"):
+            if setting.name in INVERTED_SETTINGS:
                 from_val = setting.range.max_value
                 to_val = setting.range.min_value
             else:
@@ -273,7 +412,7 @@ class GUISimulator(BaseSimulator):
             frame.grid_columnconfigure(1, weight=1)
             
             # Value label
-            value_label = ttk.Label(frame, text=f"{setting.current_value:.2%}")
+            value_label = ttk.Label(frame, text=format_percent(setting.current_value))
             value_label.grid(row=0, column=2, padx=5)
             
             # Store widgets
@@ -284,8 +423,8 @@ class GUISimulator(BaseSimulator):
                 def update_value(event):
                     if self.running:
                         value = float(sl.get())  # Get current slider value
-                        s.current_value = value
-                        vl.configure(text=f"{s.current_value:.2%}")
+                        s.current_value = s.range.clamp(value)
+                        vl.configure(text=format_percent(s.current_value))
                 return update_value
             slider.bind("<ButtonRelease-1>", make_update_func())
         
@@ -300,14 +439,7 @@ class GUISimulator(BaseSimulator):
     
     def _handle_key_event(self, input_type: SimulatorInput):
         """Handle keyboard input events."""
-        if self.handle_input(input_type):
-            current = self.state.get_current_setting()
-            if current:
-                # Update slider and value label
-                slider, value_label, _ = self.sliders[current.name]
-                slider.set(current.current_value)
-                value_label.configure(text=f"{current.current_value:.2%}")
-            self._update_highlight()
+        self.handle_input(input_type)
     
     def start(self):
         """Start the GUI simulator."""
@@ -321,18 +453,74 @@ class GUISimulator(BaseSimulator):
         self.root.quit()
     
     def handle_input(self, input_type: SimulatorInput):
-        """Handle input and update GUI."""
+        """Handle input and schedule a GUI refresh."""
         if super().handle_input(input_type):
             current = self.state.get_current_setting()
-            if current:
-                # Update slider and value label
-                slider, value_label, _ = self.sliders[current.name]
-                slider.set(current.current_value)
-                value_label.configure(text=f"{current.current_value:.2%}")
-            self._update_highlight()
+            self._schedule_refresh([current] if current else [])
             return True
         return False
     
+    def handle_inputs(self, inputs: Iterable[SimulatorInput]):
+        """Handle a batch of inputs and schedule one GUI refresh."""
+        if super().handle_inputs(inputs):
+            self._schedule_refresh(self.settings)
+            return True
+        return False
+    
+    def _schedule_refresh(self, settings: Iterable[ProSetting]):
+        """Mark settings for repainting; Tk repaints them once when it next goes idle."""
+        with self._refresh_lock:
+            self._dirty.update(settings)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self.root.after_idle(self.flush_ui)
+    
+    def flush_ui(self):
+        """Repaint the settings changed since the last refresh, then the highlight."""
+        with self._refresh_lock:
+            dirty, self._dirty = self._dirty, set()
+            self._flush_scheduled = False
+        for setting in dirty:
+            slider, value_label, _ = self.sliders[setting.name]
+            slider.set(setting.current_value)
+            value_label.configure(text=format_percent(setting.current_value))
+        self._update_highlight()
+    
+    def widget_state(self) -> Dict[str, SliderState]:
+        """Read every setting's slider, label and highlight in one pass."""
+        self.flush_ui()
+        return {
+            name: SliderState(
+                value=float(slider.get()),
+                from_=float(slider.cget("from")),
+                to=float(slider.cget("to")),
+                text=value_label.cget("text"),
+                highlighted=str(frame.cget("style")) == "Highlight.TFrame"
+            )
+            for name, (slider, value_label, frame) in self.sliders.items()
+        }
+    
+    def _sync_sliders(self):
+        """Set every slider and value label from its setting."""
+        for setting in self.settings:
+            slider, value_label, _ = self.sliders[setting.name]
+            slider.set(setting.current_value)
+            value_label.configure(text=format_percent(setting.current_value))
+    
+    def goto(self, name: str):
+        """Jump straight to a setting and move the highlight to it."""
+        super().goto(name)
+        self._update_highlight()
+    
+    def restore(self, snapshot):
+        """Restore a snapshot and bring the sliders and highlight back in line."""
+        super().restore(snapshot)
+        self._sync_sliders()
+        for _, _, frame in self.sliders.values():
+            frame.configure(style='TFrame')
+        self._update_highlight()
+    
     def handle_timeout(self, reason: str):
         """Handle timeout in GUI."""
         super().handle_timeout(reason)
@@ -355,16 +543,16 @@ class CLISimulator(BaseSimulator):
     def start(self):
         """Start the CLI simulator."""
         super().start()
-        self._display_current_setting()
         
-        # Start key input thread
+        # Wait for simulator to stop
+        self._stop_event.wait()
+    
+    def _on_start(self):
+        """Show the first setting and start the key input thread."""
+        self._display_current_setting()
         self._key_thread = threading.Thread(target=self._handle_key_input)
         self._key_thread.daemon = True
         self._key_thread.start()
-        
-        # Wait for simulator to stop
-        while self.running:
-            time.sleep(0.1)
     
     def stop(self):
         """Stop the CLI simulator."""
@@ -377,11 +565,10 @@ class CLISimulator(BaseSimulator):
         if super().handle_input(input_type):
             self._display_current_setting()
     
-    def _display_current_setting(self):
-        """Display the current setting."""
-        current = self.state.get_current_setting()
-        if current:
-            print(f"\r{current.name}: {current.current_value:.2%} ", end='')
+    def handle_inputs(self, inputs: Iterable[SimulatorInput]):
+        """Handle a batch of inputs and update the display once."""
+        if super().handle_inputs(inputs):
+            self._display_current_setting()
     
     def _handle_key_input(self):
         """Handle keyboard input in CLI."""
@@ -391,8 +578,11 @@ class CLISimulator(BaseSimulator):
                 if msvcrt.kbhit():
                     key = msvcrt.getch()
                     self._process_key(key)
+                else:
+                    # getch() can't be interrupted by stop(), so idle on the stop event between polls
+                    self._stop_event.wait(0.02)
         except ImportError:
-            import sys, tty, termios  # Unix
+            import tty, termios  # Unix
             fd = sys.stdin.fileno()
             old_settings = termios.tcgetattr(fd)
             try: